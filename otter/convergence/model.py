@@ -232,7 +232,7 @@ def _validate_state(_1, _2, state):
         raise AssertionError("{0} is not a ServerState".format(state))
 
 
-@attr.s(repr=False)
+@attr.s(repr=False, frozen=True, slots=True)
 class NovaServer(object):
     """
     Information about a server that was retrieved from Nova.
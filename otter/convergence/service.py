@@ -182,19 +182,19 @@ def is_autoscale_active(server, lb_nodes):
 
     :return: True if server is in LB nodes, False otherwise
     """
-
-    def all_met(server, current_lb_nodes):
-        """Determine if a server is in all the LBs it wants to be in."""
-        desired_lbs = server.desired_lbs
-        met_desireds = set([
-            desired for desired in desired_lbs
-            for node in current_lb_nodes
-            if desired.equivalent_definition(node.description)])
-        return desired_lbs == met_desireds
-
-    return (server.state == ServerState.ACTIVE and
-            all_met(server, [node for node in lb_nodes
-                             if node.matches(server)]))
+    if server.state != ServerState.ACTIVE:
+        return False
+    if not server.desired_lbs:
+        return True
+
+    # Nodes are matched through the polymorphic ILBNode/ILBDescription
+    # methods, so they cannot be looked up by key - but the nodes are only
+    # scanned once per server, and checking stops at the first unmet LB.
+    current_lb_nodes = [node for node in lb_nodes if node.matches(server)]
+    return all(
+        any(desired.equivalent_definition(node.description)
+            for node in current_lb_nodes)
+        for desired in server.desired_lbs)
 
 
 def update_servers_cache(group, now, servers, lb_nodes, lbs,
@@ -7,6 +7,28 @@ from lxml import etree
 _namespaces = {'atom': 'http://www.w3.org/2005/Atom'}
 
 
+def _compile(path):
+    """
+    Compile an XPath expression once, so that it does not have to be parsed
+    every time it is evaluated.
+
+    :type path: ``str``
+
+    :return: a callable :class:`lxml.etree.XPath` that takes an element (and
+        values for any XPath variables in ``path`` as keyword arguments)
+    """
+    return etree.XPath(path, namespaces=_namespaces)
+
+
+_entries = _compile('./atom:entry')
+_links = _compile('./atom:link[@rel=$rel]')
+_summaries = _compile('./atom:summary')
+_contents = _compile('./atom:content')
+_categories = _compile('./atom:category')
+_categories_containing = _compile('./atom:category[contains(@term, $term)]')
+_updated = _compile('./atom:updated')
+
+
 def parse(feed_data):
     """
     Get a tree from feed data
@@ -28,7 +50,7 @@ def xpath(path, elem):
     :return: whatever `lxml.xpath` would return based on the path, but
         should be used to obtain a list of :class:`Elements`
     """
-    return etree.XPath(path, namespaces=_namespaces)(elem)
+    return _compile(path)(elem)
 
 
 def entries(feed):
@@ -39,7 +61,7 @@ def entries(feed):
 
     :return: ``list`` of atom entry :class:`Elements`
     """
-    return xpath('./atom:entry', feed)
+    return _entries(feed)
 
 
 def _link(feed, direction):
@@ -52,7 +74,7 @@ def _link(feed, direction):
     :return: the URL to the previous feed if found, otherwise ``None``
     :rtype: ``str``
     """
-    links = xpath('./atom:link[@rel="{}"]'.format(direction), feed)
+    links = _links(feed, rel=direction)
 
     if len(links) == 0:
         return None
@@ -93,7 +115,7 @@ def summary(entry):
     :return: the summary text
     :rtype: ``str``
     """
-    summaries = xpath('./atom:summary', entry)
+    summaries = _summaries(entry)
 
     if len(summaries) == 0:
         return None
@@ -110,7 +132,7 @@ def content(entry):
     :return: the content text
     :rtype: ``str``
     """
-    contents = xpath('./atom:content', entry)
+    contents = _contents(entry)
 
     if len(contents) == 0:
         return None
@@ -131,11 +153,12 @@ def categories(entry, term_contains=None):
         categories if ``term_contains`` is None
     :rtype: ``str``
     """
-    exp = './atom:category'
     if term_contains:
-        exp += '[contains(@term, "{0}")]'.format(term_contains)
+        matching = _categories_containing(entry, term=term_contains)
+    else:
+        matching = _categories(entry)
 
-    return [x.attrib['term'] for x in xpath(exp, entry)]
+    return [x.attrib['term'] for x in matching]
 
 
 def updated(entry):
@@ -147,4 +170,4 @@ def updated(entry):
     :return: the updated timestamp
     :rtype: ``str``
     """
-    return xpath('./atom:updated', entry)[0].text
+    return _updated(entry)[0].text
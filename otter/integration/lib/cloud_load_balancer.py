@@ -131,7 +131,8 @@ class CloudLoadBalancer(object):
 
     @diagnose("clb", "Wait for CLB to achieve a particular status")
     def wait_for_state(
-        self, rcs, state_desired, timeout, period=10, clock=reactor
+        self, rcs, state_desired, timeout, period=10, clock=reactor,
+        poller=None
     ):
         """
         Wait for the cloud load balancer to reach a certain state.  After
@@ -147,6 +148,10 @@ class CloudLoadBalancer(object):
         :param twisted.internet.interfaces.IReactorTime clock: If provided,
             the clock to use for scheduling things.  Defaults to `reactor`
             if not specified.
+        :param callable poller: If provided, a function with the same
+            signature as :func:`otter.integration.lib.utils.poll_until`, used
+            to poll instead of waiting ``period`` seconds between polls.
+            ``timeout`` is passed to it as the deadline.
         :result: A `Deferred` which if fired, returns the same test resources
             as provided this method.  This signifies the state has been
             reached.  If the state has not been attained in the timeout period,
@@ -159,13 +164,15 @@ class CloudLoadBalancer(object):
 
             raise TransientRetryError()
 
-        @_retry("Waiting for cloud load balancer to reach state {}".format(
-                state_desired),
-                timeout=timeout, period=period, clock=clock)
         def poll():
             return self.get_state(rcs).addCallback(check)
 
-        return poll()
+        reason = "Waiting for cloud load balancer to reach state {}".format(
+            state_desired)
+        if poller is not None:
+            return poller(poll, deadline=timeout, clock=clock, reason=reason)
+        return _retry(reason, timeout=timeout, period=period, clock=clock)(
+            poll)()
 
     @diagnose("clb", "Cleaning up CLB")
     def stop(self, rcs):
@@ -275,8 +282,32 @@ class CloudLoadBalancer(object):
         d.addCallback(self.treq.json_content)
         return d
 
+    @diagnose("clb", "Checking the number of CLB nodes")
+    def assert_node_count(self, rcs, count):
+        """
+        Assert, with a single listing of the nodes, that the load balancer
+        has exactly ``count`` nodes.  Unlike :func:`wait_for_nodes`, this does
+        not poll, so it should only be used when the nodes are known to have
+        already settled.
+
+        :param rcs: a :class:`otter.integration.lib.resources.TestResources`
+            instance
+        :param int count: The number of nodes the load balancer should have.
+
+        :return: A `Deferred` that fires with the list of nodes, or fails
+            with :class:`AssertionError` if there are not ``count`` of them.
+        """
+        def check(nodes):
+            mismatch = HasLength(count).match(nodes['nodes'])
+            if mismatch:
+                raise AssertionError(mismatch.describe())
+            return nodes['nodes']
+
+        return self.list_nodes(rcs).addCallback(check)
+
     @diagnose("clb", "Waiting for CLB nodes to reach a particular state")
-    def wait_for_nodes(self, rcs, matcher, timeout, period=10, clock=reactor):
+    def wait_for_nodes(self, rcs, matcher, timeout, period=10, clock=reactor,
+                       poller=None):
         """
         Wait for the nodes on the load balancer to reflect a certain state,
         specified by matcher.
@@ -291,6 +322,10 @@ class CloudLoadBalancer(object):
         :param period: How long to wait before polling again.
         :param clock: a :class:`twisted.internet.interfaces.IReactorTime`
             provider
+        :param poller: If provided, a function with the same signature as
+            :func:`otter.integration.lib.utils.poll_until`, used to poll
+            instead of waiting ``period`` seconds between polls.  ``timeout``
+            is passed to it as the deadline.
 
         :return: the list of nodes, if the state is reached
         :raises: :class:`TimedOutError` if the state is never reached within
@@ -316,12 +351,14 @@ class CloudLoadBalancer(object):
                 raise TransientRetryError(mismatch.describe())
             return nodes['nodes']
 
-        @_retry("Waiting for nodes to reach state {0}".format(str(matcher)),
-                timeout=timeout, period=period, clock=clock)
         def poll():
             return self.list_nodes(rcs).addCallback(check)
 
-        return poll()
+        reason = "Waiting for nodes to reach state {0}".format(str(matcher))
+        if poller is not None:
+            return poller(poll, deadline=timeout, clock=clock, reason=reason)
+        return _retry(reason, timeout=timeout, period=period, clock=clock)(
+            poll)()
 
     @diagnose("clb", "Updating a CLB node")
     def update_node(self, rcs, node_id, weight=None, condition=None,
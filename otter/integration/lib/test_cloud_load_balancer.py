@@ -443,6 +443,58 @@ class WaitForNodesTestCase(SynchronousTestCase):
         self.assertEqual(5, self.get_calls)
         self.failureResultOf(d, TimedOutError)
 
+    def test_uses_poller_if_provided(self):
+        """
+        If a poller is provided, it is used to poll for the node state, with
+        ``timeout`` as its deadline.
+        """
+        self.nodes = {'nodes': ['done']}
+        polled = []
+
+        def poller(poll, deadline, clock, reason):
+            polled.append((deadline, clock))
+            return poll()
+
+        d = self.clb.wait_for_nodes(
+            self.rcs,
+            Equals(['done']),
+            timeout=5,
+            clock=self.clock,
+            poller=poller)
+        self.assertEqual(['done'], self.successResultOf(d))
+        self.assertEqual([(5, self.clock)], polled)
+        self.assertEqual(1, self.get_calls)
+
+
+class AssertNodeCountTestCase(SynchronousTestCase):
+    """
+    Tests for :func:`CloudLoadBalancer.assert_node_count`.
+    """
+    def setUp(self):
+        """
+        Set up a load balancer whose node listing is stubbed out.
+        """
+        self.rcs = _FakeRCS()
+        self.nodes = [{'id': 1}, {'id': 2}]
+        self.clb = CloudLoadBalancer(pool=object())
+        self.clb.list_nodes = lambda rcs: succeed({'nodes': self.nodes})
+
+    def test_right_number_of_nodes(self):
+        """
+        If the load balancer has the given number of nodes, the nodes are
+        returned.
+        """
+        d = self.clb.assert_node_count(self.rcs, 2)
+        self.assertEqual(self.successResultOf(d), self.nodes)
+
+    def test_wrong_number_of_nodes(self):
+        """
+        If the load balancer does not have the given number of nodes,
+        :class:`AssertionError` is raised without retrying.
+        """
+        d = self.clb.assert_node_count(self.rcs, 3)
+        self.failureResultOf(d, AssertionError)
+
 
 class MatcherTestCase(SynchronousTestCase):
     """
@@ -5,6 +5,7 @@ from pyrsistent import pmap, pset
 
 from twisted.internet.defer import FirstError, fail
 from twisted.internet.error import ConnectionRefusedError
+from twisted.internet.task import Clock
 from twisted.python.failure import Failure
 from twisted.trial.unittest import SynchronousTestCase
 
@@ -19,10 +20,13 @@ from otter.integration.lib.utils import (
     OvershootError,
     UndershootError,
     diagnose,
-    measure_progress
+    measure_progress,
+    poll_until
 )
 
+from otter.util.deferredutils import TimedOutError
 from otter.util.http import APIError, UpstreamError
+from otter.util.retry import TransientRetryError
 
 
 class MeasureProgressTests(SynchronousTestCase):
@@ -279,3 +283,66 @@ class DiagnoseTests(SynchronousTestCase):
             diagnose("system", "operation")(lambda: fail(err))(), FirstError)
 
         self.assertIs(f.value, err)
+
+
+class PollUntilTests(SynchronousTestCase):
+    """
+    Tests for :func:`poll_until`.
+    """
+    def setUp(self):
+        """
+        Set up a clock and a predicate that records when it was called.
+        """
+        self.clock = Clock()
+        self.calls = []
+        self.done = False
+
+        def predicate():
+            self.calls.append(self.clock.seconds())
+            if not self.done:
+                raise TransientRetryError()
+            return 'done'
+
+        self.predicate = predicate
+
+    def test_backs_off_exponentially_up_to_cap(self):
+        """
+        The interval between polls starts at ``initial`` and grows by
+        ``factor`` every poll, but never beyond ``cap``.
+        """
+        d = poll_until(self.predicate, initial=1, factor=2, cap=5,
+                       deadline=100, clock=self.clock)
+        self.clock.pump([1] * 20)
+        self.assertNoResult(d)
+        self.assertEqual(self.calls, [0, 1, 3, 7, 12, 17])
+
+        self.done = True
+        self.clock.advance(5)
+        self.assertEqual(self.successResultOf(d), 'done')
+
+    def test_succeeds_immediately(self):
+        """
+        If the predicate succeeds on the first try, no waiting is done.
+        """
+        self.done = True
+        d = poll_until(self.predicate, clock=self.clock)
+        self.assertEqual(self.successResultOf(d), 'done')
+        self.assertEqual(self.calls, [0])
+
+    def test_times_out_at_deadline(self):
+        """
+        If the predicate never succeeds, :func:`poll_until` fails with
+        :class:`TimedOutError` once the deadline passes.
+        """
+        d = poll_until(self.predicate, deadline=10, clock=self.clock,
+                       reason="waiting")
+        self.clock.pump([1] * 10)
+        f = self.failureResultOf(d, TimedOutError)
+        self.assertIn("waiting", str(f.value))
+
+    def test_stops_on_other_errors(self):
+        """
+        Errors other than :class:`TransientRetryError` are not retried.
+        """
+        d = poll_until(lambda: fail(ValueError('bad')), clock=self.clock)
+        self.failureResultOf(d, ValueError)
@@ -192,6 +192,22 @@ def setup_test_log_observer(testcase):
     testcase.addCleanup(logfile.close)
 
 
+class ShutdownCleanup(object):
+    """
+    A stand-in for a test case, for resources that are shared between
+    tests and hence should not be cleaned up when any single test finishes.
+
+    Cleanups added to it run when the reactor shuts down, which trial does
+    once all the tests have run.
+    """
+    def addCleanup(self, f, *args, **kwargs):
+        """
+        Run ``f`` with the given arguments before the reactor shuts down.
+        """
+        reactor.addSystemEventTrigger('before', 'shutdown', f, *args,
+                                      **kwargs)
+
+
 def get_utcstr_from_now(seconds):
     """ Get UTC timestamp from now in ISO 8601 format """
     return "{}Z".format(
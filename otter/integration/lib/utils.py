@@ -8,11 +8,16 @@ from characteristic import Attribute, attributes
 
 from pyrsistent import PSet
 
+from toolz.itertoolz import iterate
+
+from twisted.internet import reactor
 from twisted.internet.defer import FirstError
 from twisted.internet.error import ConnectionRefusedError
 
 from otter.convergence.model import ServerState
+from otter.util.deferredutils import retry_and_timeout
 from otter.util.http import APIError, UpstreamError
+from otter.util.retry import TransientRetryError, terminal_errors_except
 
 
 class OvershootError(AssertionError):
@@ -130,3 +135,40 @@ def diagnose(system, message):
             return f(*args, **kwargs).addErrback(wrap_failure)
         return new_function
     return decorate
+
+
+def poll_until(predicate, initial=0.25, factor=1.5, cap=5.0, deadline=120,
+               clock=reactor, reason=None):
+    """
+    Poll ``predicate`` until it succeeds, backing off exponentially between
+    attempts, so that state that is reached quickly is noticed quickly
+    instead of only after a long fixed interval.
+
+    The first retry happens after ``initial`` seconds, and every subsequent
+    interval is ``factor`` times the previous one, up to ``cap`` seconds.
+
+    :param callable predicate: Takes no arguments, and returns a result or a
+        `Deferred`.  It should raise :class:`TransientRetryError` if the
+        desired state has not been reached yet - any other error stops the
+        polling.
+    :param float initial: The number of seconds to wait before the first
+        retry.
+    :param float factor: How much longer to wait before each next retry.
+    :param float cap: The maximum number of seconds to wait between retries.
+    :param float deadline: The number of seconds after which to give up.
+    :param clock: a :class:`twisted.internet.interfaces.IReactorTime`
+        provider
+    :param str reason: A description of what is being waited for, used if
+        the deadline passes.
+
+    :return: A `Deferred` which fires with the result of ``predicate``, or
+        fails with :class:`TimedOutError` if ``deadline`` is reached first.
+    """
+    intervals = iterate(lambda interval: min(interval * factor, cap),
+                        min(initial, cap))
+    return retry_and_timeout(
+        predicate, deadline,
+        can_retry=terminal_errors_except(TransientRetryError),
+        next_interval=lambda _: next(intervals),
+        clock=clock,
+        deferred_description=reason)
@@ -4,19 +4,25 @@ Tests covering the Load Balancer self healing behaviors
 
 from __future__ import print_function
 
+import re
+
 from testtools.matchers import (
     ContainsDict,
     Equals,
     MatchesAll,
-    MatchesRegex,
     MatchesListwise,
+    MatchesPredicate,
     MatchesSetwise
 )
 
-from twisted.internet.defer import gatherResults, inlineCallbacks, returnValue
+from twisted.internet import reactor
+from twisted.internet.defer import (
+    gatherResults, inlineCallbacks, returnValue, succeed)
 
 from twisted.trial import unittest
 
+from twisted.web.client import HTTPConnectionPool
+
 from otter.integration.lib.autoscale import ScalingPolicy
 from otter.integration.lib.cloud_load_balancer import (
     CloudLoadBalancer,
@@ -27,40 +33,112 @@ from otter.integration.lib.cloud_load_balancer import (
 from otter.integration.lib.nova import NovaServer
 from otter.integration.lib.resources import TestResources
 from otter.integration.lib.trial_tools import (
+    ShutdownCleanup,
     TestHelper,
     convergence_interval,
     get_identity,
     get_resource_mapping,
     region,
 )
+from otter.integration.lib.utils import poll_until
+from otter.log import log
+from otter.util.logging_treq import LoggingTreq
 
 timeout_default = 600
 
+# Upper bound on waits that use adaptive polling - these return as soon as
+# the state is reached, so this only matters if something is wrong.
+adaptive_timeout = 120
+
+# Extra time given to the test that creates the shared resources: the
+# authentication, CLB creation, and waiting up to `timeout_default` for the
+# CLB to become ACTIVE all happen in its setUp.
+shared_resources_timeout = timeout_default + adaptive_timeout
+
+_IPV4_RE = re.compile(r"(\d+\.){3}\d+")
+
+IsIPv4Address = MatchesPredicate(
+    lambda address: _IPV4_RE.match(address) is not None,
+    "%r is not an IPv4 address")
+"""
+Matcher that asserts that a string starts with an IPv4 address.  It uses a
+precompiled regex, since it is applied to every server on every poll.
+"""
+
 
 class TestLoadBalancerSelfHealing(unittest.TestCase):
     """
     This class contains test cases to test the load balancer healing
     function of the Otter Converger.
+
+    Creating a CLB takes a long time, so all the tests share one
+    authenticated :class:`TestResources` and one CLB, which are created by
+    the first test to run and deleted once the trial run is over.  The test
+    timeouts only cover the test itself - see :meth:`getTimeout`.
     """
-    timeout = 1800
+    rcs = None
+    clb = None
+
+    def getTimeout(self):
+        """
+        Trial applies a test's timeout to its setUp as well, so give the
+        test that has to create the shared resources in its setUp
+        `shared_resources_timeout` more time.  This way running a single
+        test on its own does not time out while creating the CLB.
+        """
+        timeout = super(TestLoadBalancerSelfHealing, self).getTimeout()
+        if self.clb is None:
+            timeout += shared_resources_timeout
+        return timeout
+
+    @classmethod
+    def set_up_shared_resources(cls):
+        """
+        Authenticate and create the CLB shared by all the tests, unless that
+        has already been done.
+
+        :return: a `Deferred` that fires with the shared
+            :class:`TestResources` once the CLB is ACTIVE.
+        """
+        if cls.clb is not None:
+            return succeed(cls.rcs)
+
+        pool = HTTPConnectionPool(reactor, False)
+        clb = CloudLoadBalancer(pool=pool,
+                                treq=LoggingTreq(log=log, log_response=True))
+        rcs = TestResources()
+        d = get_identity(pool=pool).authenticate_user(
+            rcs,
+            resources=get_resource_mapping(),
+            region=region)
+        d.addCallback(clb.start, ShutdownCleanup())
+        d.addCallback(clb.wait_for_state, "ACTIVE", timeout_default,
+                      poller=poll_until)
+
+        def record(_):
+            cls.rcs, cls.clb = rcs, clb
+            return rcs
 
+        return d.addCallback(record)
+
+    @inlineCallbacks
     def setUp(self):
         """
         Establish resources used for each test, such as the auth token
-        and a load balancer.
+        and a load balancer, and remove any nodes left on the load balancer
+        by previous tests.
         """
-        self.helper = TestHelper(self, num_clbs=1)
-        self.rcs = TestResources()
-        self.identity = get_identity(pool=self.helper.pool)
-        return self.identity.authenticate_user(
-            self.rcs,
-            resources=get_resource_mapping(),
-            region=region,
-        ).addCallback(lambda _: gatherResults([
-            clb.start(self.rcs, self)
-            .addCallback(clb.wait_for_state, "ACTIVE", timeout_default)
-            for clb in self.helper.clbs])
-        )
+        self.helper = TestHelper(self)
+        yield self.set_up_shared_resources()
+        self.helper.clbs = [self.clb]
+
+        nodes = yield self.clb.list_nodes(self.rcs)
+        if nodes['nodes']:
+            yield self.clb.delete_nodes(
+                self.rcs, [node['id'] for node in nodes['nodes']])
+            yield self.clb.wait_for_nodes(
+                self.rcs, HasLength(0), timeout=adaptive_timeout,
+                poller=poll_until)
 
     @inlineCallbacks
     def create_another_clb(self):
@@ -109,18 +187,20 @@ class TestLoadBalancerSelfHealing(unittest.TestCase):
         5. Assert that the server is put back on the CLB.
         """
         clb = self.helper.clbs[0]
-        yield self.confirm_clb_nodecounts([(clb, 0)])
+        yield clb.assert_node_count(self.rcs, 0)
 
         group, _ = self.helper.create_group(min_entities=1)
         yield self.helper.start_group_and_wait(group, self.rcs)
 
-        clbs_nodes = yield self.confirm_clb_nodecounts([(clb, 1)])
-        the_node = clbs_nodes[0][0]
+        # start_group_and_wait has already waited for the server's node
+        nodes = yield clb.assert_node_count(self.rcs, 1)
+        the_node = nodes[0]
 
         yield clb.delete_nodes(self.rcs, [the_node['id']])
 
         yield clb.wait_for_nodes(
-            self.rcs, HasLength(0), timeout=timeout_default)
+            self.rcs, HasLength(0), timeout=adaptive_timeout,
+            poller=poll_until)
         yield group.trigger_convergence(self.rcs)
 
         yield clb.wait_for_nodes(
@@ -129,9 +209,12 @@ class TestLoadBalancerSelfHealing(unittest.TestCase):
                 HasLength(1),
                 ContainsAllIPs([the_node["address"]])
             ),
-            timeout=timeout_default
+            timeout=adaptive_timeout,
+            poller=poll_until
         )
 
+    test_oob_deleted_clb_node.timeout = 180
+
     @inlineCallbacks
     def test_move_node_to_oob_lb(self):
         """
@@ -186,55 +269,54 @@ class TestLoadBalancerSelfHealing(unittest.TestCase):
             )
         ])
 
+    test_move_node_to_oob_lb.timeout = 1800
+
     @inlineCallbacks
     def test_only_autoscale_nodes_are_modified(self):
         """
         Autoscale only self-heals the nodes that it added, without touching
         any other nodes.  Assuming 1 CLB:
-        1. Create two non-autoscaled servers and add them to the CLB.
+        1. Create two non-autoscaled servers and add them to the CLB, while
+           at the same time creating a scaling group with said CLB and 1
+           server, and waiting for the AS server to be active and on the CLB.
         2. Wait for all servers to be on the CLB
-        3. Create a scaling group with said CLB and 1 server
-        4. Wait for AS server to be active and on the CLB.
-        4. Delete autoscaled server and 1 non-autoscaled server from the CLB
-        5. Converge
-        6. Assert that the autoscaled server is put back on the CLB, the
+        3. Delete autoscaled server and 1 non-autoscaled server from the CLB
+        4. Converge
+        5. Assert that the autoscaled server is put back on the CLB, the
            non-autoscaled server is left off the CLB, and the untouched
            non-autoscaled server is left on the CLB.
         """
         clb = self.helper.clbs[0]
 
-        nodes = yield clb.list_nodes(self.rcs)
-        self.assertEqual(len(nodes['nodes']), 0,
-                         "There should be no nodes on the CLB yet.")
+        yield clb.assert_node_count(self.rcs, 0)
 
         # create the other two non-autoscaled servers - just wait until they
         # have servicenet addresses - don't bother waiting for them to be
-        # active, which will take too long
-        other_servers = yield self.helper.create_servers(
+        # active, which will take too long - and add them to the CLB
+        d_other = self.helper.create_servers(
             self.rcs, 2, wait_for=ContainsDict({
                 "addresses": ContainsDict({
                     'private': MatchesSetwise(
-                        ContainsDict({
-                            "addr": MatchesRegex("(\d+\.){3}\d+")
-                        })
+                        ContainsDict({"addr": IsIPv4Address})
                     )
                 })
             }))
-        # add non-autoscaled servers to the CLB
-        clb_response = yield clb.add_nodes(
+        d_other.addCallback(lambda other_servers: clb.add_nodes(
             self.rcs,
             [{'address': server['addresses']['private'][0]['addr'],
               'port': 8080,
-              'condition': "ENABLED"} for server in other_servers])
-        remove_non_as_node, untouch_non_as_node = clb_response['nodes']
+              'condition': "ENABLED"} for server in other_servers]))
 
-        # set up the group and get the group's server's CLB node
+        # meanwhile, set up the group and wait for its server to be on the
+        # CLB - this does not depend on the non-autoscaled servers
         group, _ = self.helper.create_group(min_entities=1)
-        yield self.helper.start_group_and_wait(group, self.rcs)
+        d_group = self.helper.start_group_and_wait(group, self.rcs)
+
+        clb_response, _ = yield gatherResults([d_other, d_group])
+        remove_non_as_node, untouch_non_as_node = clb_response['nodes']
 
         # Should be 3 nodes now that all servers are added
-        nodes = yield clb.wait_for_nodes(
-            self.rcs, HasLength(3), timeout=timeout_default)
+        nodes = yield clb.assert_node_count(self.rcs, 3)
         as_node = [node for node in nodes
                    if node not in (remove_non_as_node, untouch_non_as_node)][0]
 
@@ -243,7 +325,8 @@ class TestLoadBalancerSelfHealing(unittest.TestCase):
                                [as_node['id'], remove_non_as_node['id']])
         # There should be 1 node left
         yield clb.wait_for_nodes(
-            self.rcs, HasLength(1), timeout=timeout_default)
+            self.rcs, HasLength(1), timeout=adaptive_timeout,
+            poller=poll_until)
 
         yield group.trigger_convergence(self.rcs)
 
@@ -259,9 +342,12 @@ class TestLoadBalancerSelfHealing(unittest.TestCase):
                     if k in ('address', 'port', 'weight' 'type', 'condition')
                 })
             ),
-            timeout=timeout_default
+            timeout=adaptive_timeout,
+            poller=poll_until
         )
 
+    test_only_autoscale_nodes_are_modified.timeout = 180
+
     @inlineCallbacks
     def test_heal_clb_node_attribute_changes(self):
         """
@@ -300,6 +386,8 @@ class TestLoadBalancerSelfHealing(unittest.TestCase):
             timeout=timeout_default
         )
 
+    test_heal_clb_node_attribute_changes.timeout = 1800
+
     @inlineCallbacks
     def test_convergence_heals_two_groups_on_same_clb(self):
         """
@@ -364,6 +452,8 @@ class TestLoadBalancerSelfHealing(unittest.TestCase):
         yield clb.wait_for_nodes(
             self.rcs, MatchesSetwise(*expected_nodes), timeout=timeout_default)
 
+    test_convergence_heals_two_groups_on_same_clb.timeout = 1800
+
     @inlineCallbacks
     def _disown_change_and_converge(self, remove_from_clb):
         """
@@ -460,6 +550,8 @@ class TestLoadBalancerSelfHealing(unittest.TestCase):
             ),
         ])
 
+    test_changing_disowned_server_is_not_converged_1.timeout = 1800
+
     @inlineCallbacks
     def test_changing_disowned_server_is_not_converged_2(self):
         """
@@ -513,6 +605,8 @@ class TestLoadBalancerSelfHealing(unittest.TestCase):
             )
         ])
 
+    test_changing_disowned_server_is_not_converged_2.timeout = 1800
+
     @inlineCallbacks
     def test_draining(self):
         """
@@ -563,3 +657,5 @@ class TestLoadBalancerSelfHealing(unittest.TestCase):
                           "pendingCapacity": Equals(0),
                           "desiredCapacity": Equals(0),
                           "status": Equals("ACTIVE")}))
+
+    test_draining.timeout = 1800
@@ -3,10 +3,12 @@ Format logs based on specification
 """
 import json
 import math
+import operator
 
 from toolz.curried import assoc
-from toolz.dicttoolz import keyfilter
+from toolz.dicttoolz import dissoc
 from toolz.functoolz import compose, curry
+from toolz.itertoolz import accumulate
 
 from twisted.python.failure import Failure
 
@@ -39,31 +41,81 @@ def split_execute_convergence(event, max_length=event_max_length):
         have one tuple.
     """
     message = "Executing convergence"
-    if _json_len(event) <= max_length:
+    sizes = _key_sizes(event)
+    if _dict_len(sizes) <= max_length:
         return [(event, message)]
 
     events = [(event, message)]
-    large_things = sorted(('servers', 'lb_nodes'),
-                          key=compose(_json_len, event.get),
+    large_things = sorted((k for k in ('servers', 'lb_nodes') if k in sizes),
+                          key=lambda k: sizes[k] - _json_len(k),
                           reverse=True)
 
     # simplified event which serves as a base for the split out events
-    base_event = keyfilter(
-        lambda k: k not in ('desired', 'servers', 'lb_nodes', 'steps'),
-        event)
+    dropped = [k for k in ('desired', 'servers', 'lb_nodes', 'steps')
+               if k in event]
+    base_event = dissoc(event, *dropped)
 
     for thing in large_things:
-        split_up_events = split(
-            assoc(base_event, thing), event[thing], max_length,
-            _json_len)
+        elements = event[thing]
+        split_up_events = _split_by_size(
+            assoc(base_event, thing), elements,
+            [_json_len(element) for element in elements],
+            _json_len(assoc(base_event, thing, [])), max_length)
         events.extend([(e, message) for e in split_up_events])
         del event[thing]
-        if _json_len(event) <= max_length:
+        del sizes[thing]
+        if _dict_len(sizes) <= max_length:
             break
 
     return events
 
 
+def _key_sizes(event):
+    """
+    Compute the JSON-formatted length of each ``"key": value`` pair in the
+    event, so the length of the whole event (and of the event with some keys
+    removed) can be worked out without serializing it again.
+    """
+    return {k: _json_len({k: v}) - 2 for k, v in event.iteritems()}
+
+
+def _dict_len(sizes):
+    """
+    Length of the JSON-formatted dictionary whose pairs have the given
+    lengths, as computed by :func:`_key_sizes`.
+    """
+    return 2 + sum(sizes.itervalues()) + 2 * max(len(sizes) - 1, 0)
+
+
+def _split_by_size(render, elements, element_sizes, overhead, max_len):
+    """
+    Like :func:`split`, but works out the length of each rendered sub-list
+    from the precomputed JSON lengths of the elements instead of rendering
+    and serializing every candidate sub-list.
+
+    :param callable render: As in :func:`split`.
+    :param list elements: As in :func:`split`.
+    :param list element_sizes: JSON-formatted length of each element.
+    :param int overhead: JSON-formatted length of the rendered empty list.
+    :param int max_len: As in :func:`split`.
+
+    :return: a `list` of rendered sub-lists, split up exactly as
+        :func:`split` would have done
+    """
+    prefix = list(accumulate(operator.add, element_sizes, 0))
+
+    def _split(start, end):
+        count = end - start
+        length = (overhead + prefix[end] - prefix[start] +
+                  2 * max(count - 1, 0))
+        if count > 1 and length > max_len:
+            middle = start + int(math.ceil(count / 2.0))
+            return _split(start, middle) + _split(middle, end)
+        return [render(elements[start:end])]
+
+    return _split(0, len(elements))
+
+
 def split_list_servers(event, maxlength=event_max_length):
     """
     Split response_body in listing servers detail log such that each
@@ -307,9 +359,12 @@ def get_validated_event(event, specs=msg_types):
     Validate event's message as per msg_types and error details as
     per error_fields
 
-    :return: A list of validated events.
+    :return: A list of validated events. Events that have already been
+        validated are returned as is.
     :raises: `ValueError` or `TypeError` if `event_dict` is not valid
     """
+    if 'otter_msg_type' in event:
+        return [event]
     try:
         # message is tuple of strings
         message = ''.join(event.get("message", []))
@@ -3,6 +3,9 @@ Tests for convergence models.
 """
 from uuid import uuid4
 
+import attr
+from attr.exceptions import FrozenInstanceError
+
 from characteristic import attributes
 
 from pyrsistent import freeze, pmap, pset
@@ -635,6 +638,20 @@ class NovaServerTests(SynchronousTestCase):
         self.assertEqual(server.state, ServerState.UNKNOWN_TO_OTTER)
         self.assertEqual(server.json['status'], 'ablrduelh')
 
+    def test_immutable(self):
+        """
+        :obj:`NovaServer` instances cannot be modified, only copied with
+        changes, and are hashable.
+        """
+        server = NovaServer.from_server_details_json(self.servers[0])
+        self.assertRaises(FrozenInstanceError, setattr, server,
+                          'desired_lbs', pset())
+        changed = attr.assoc(server, desired_lbs=pset())
+        self.assertEqual(changed.desired_lbs, pset())
+        self.assertEqual(hash(server),
+                         hash(NovaServer.from_server_details_json(
+                             self.servers[0])))
+
 
 class IPAddressTests(SynchronousTestCase):
     """
@@ -721,11 +721,16 @@ class GetMyDivergentGroupsTests(SynchronousTestCase):
               'dirty-flag': '/groups/divergent/00_gr2'}])
 
 
+# The dispatchers that make this up are stateless, so one instance can be
+# shared by all the tests.
+_DISPATCHER = ComposedDispatcher([
+    reference_dispatcher,
+    base_dispatcher,
+])
+
+
 def _get_dispatcher():
-    return ComposedDispatcher([
-        reference_dispatcher,
-        base_dispatcher,
-    ])
+    return _DISPATCHER
 
 
 class NonConcurrentlyTests(SynchronousTestCase):
@@ -791,6 +796,22 @@ class NonConcurrentlyTests(SynchronousTestCase):
 class ExecuteConvergenceTests(SynchronousTestCase):
     """Tests for :func:`execute_convergence`."""
 
+    # These are never modified by the tests, so they are shared by all of
+    # them instead of being rebuilt in every setUp.  Tests that need
+    # different servers replace ``self.servers`` with new ones.
+    lc = {'args': {'server': {'name': 'foo'}, 'loadBalancers': []},
+          'type': 'launch_server'}
+    clb_desc = CLBDescription(lb_id='23', port=80)
+    desired_lbs = s(clb_desc)
+    servers = (
+        server('a', ServerState.ACTIVE, servicenet_address='10.0.0.1',
+               desired_lbs=desired_lbs,
+               links=freeze([{'href': 'link1', 'rel': 'self'}])),
+        server('b', ServerState.ACTIVE, servicenet_address='10.0.0.2',
+               desired_lbs=desired_lbs,
+               links=freeze([{'href': 'link2', 'rel': 'self'}]))
+    )
+
     def setUp(self):
         self.tenant_id = 'tenant-id'
         self.group_id = 'group-id'
@@ -798,23 +819,10 @@ class ExecuteConvergenceTests(SynchronousTestCase):
                                 {}, {}, None, {}, False,
                                 ScalingGroupStatus.ACTIVE, desired=2)
         self.group = mock_group(self.state, self.tenant_id, self.group_id)
-        self.lc = {'args': {'server': {'name': 'foo'}, 'loadBalancers': []},
-                   'type': 'launch_server'}
-
-        self.clb_desc = CLBDescription(lb_id='23', port=80)
-        self.desired_lbs = s(self.clb_desc)
         self.lb_nodes = [CLBNode(node_id='1', address='10.0.0.1',
                                  description=self.clb_desc),
                          CLBNode(node_id='2', address='10.0.0.2',
                                  description=self.clb_desc)]
-        self.servers = (
-            server('a', ServerState.ACTIVE, servicenet_address='10.0.0.1',
-                   desired_lbs=self.desired_lbs,
-                   links=freeze([{'href': 'link1', 'rel': 'self'}])),
-            server('b', ServerState.ACTIVE, servicenet_address='10.0.0.2',
-                   desired_lbs=self.desired_lbs,
-                   links=freeze([{'href': 'link2', 'rel': 'self'}]))
-        )
         self.state_active = {}
         self.cache = [thaw(self.servers[0].json.set('_is_as_active', True)),
                       thaw(self.servers[1].json.set('_is_as_active', True))]
@@ -883,8 +891,8 @@ class ExecuteConvergenceTests(SynchronousTestCase):
         `active` servers are still updated, and SUCCESS is the return value.
         """
         self.lb_nodes = ()
-        for serv in self.servers:
-            serv.desired_lbs = pset()
+        self.servers = tuple(attr.assoc(serv, desired_lbs=pset())
+                             for serv in self.servers)
         success_cache_update_time = self.now + timedelta(seconds=2)
         sequence = [
             parallel_sequence([]),
@@ -1273,8 +1281,8 @@ class ExecuteConvergenceTests(SynchronousTestCase):
         """
         self.manifest['state'].status = ScalingGroupStatus.ERROR
         self.lb_nodes = ()
-        for serv in self.servers:
-            serv.desired_lbs = pset()
+        self.servers = tuple(attr.assoc(serv, desired_lbs=pset())
+                             for serv in self.servers)
         success_cache_update_time = self.now + timedelta(seconds=2)
         sequence = [
             parallel_sequence([]),
@@ -1514,6 +1522,27 @@ class IsAutoscaleActiveTests(SynchronousTestCase):
                 lb_nodes),
             True)
 
+    def test_some_lbs_pending(self):
+        """
+        When a server is in some, but not all, of its desired LBs, it's not
+        active.
+        """
+        lb_nodes = [
+            CLBNode(node_id='1',
+                    description=CLBDescription(lb_id='foo', port=1),
+                    address='1.1.1.1'),
+            CLBNode(node_id='2',
+                    description=CLBDescription(lb_id='bar', port=2),
+                    address='1.1.1.2')]
+        desired_lbs = s(CLBDescription(lb_id='foo', port=1),
+                        CLBDescription(lb_id='bar', port=2))
+        self.assertEqual(
+            is_autoscale_active(
+                server('id1', ServerState.ACTIVE, servicenet_address='1.1.1.1',
+                       desired_lbs=desired_lbs),
+                lb_nodes),
+            False)
+
 
 class GetExecutorTests(SynchronousTestCase):
     """Tests for :func:`get_executor`."""
@@ -16,13 +16,13 @@ class SimpleAtomTestCase(SynchronousTestCase):
     """
     Tests for the public functions in :mod:`otter.indexer.atom` against a
     simple atom feed fixture.
+
+    None of the tests modify the feed, so it is only loaded and parsed
+    once, when the class is created.  (Trial does not support
+    ``setUpClass``.)
     """
-    def setUp(self):
-        """
-        Load simple atom feed fixture
-        """
-        self.simple_atom = parse(fixture("simple.atom"))
-        self.simple_entry = entries(self.simple_atom)[0]
+    simple_atom = parse(fixture("simple.atom"))
+    simple_entry = entries(simple_atom)[0]
 
     def test_parse(self):
         """
@@ -14,6 +14,7 @@ from otter.convergence.model import DesiredServerGroupState
 from otter.log.spec import (
     SpecificationObserverWrapper,
     get_validated_event,
+    split,
     split_cf_messages,
     split_execute_convergence,
     split_list_servers
@@ -127,6 +128,15 @@ class GetValidatedEventTests(SynchronousTestCase):
         e = {'message': ('unknown',), 'a': 'b'}
         self.assertEqual(get_validated_event(e), [e])
 
+    def test_already_validated(self):
+        """
+        Event that has already been validated (has otter_msg_type) is not
+        changed, even if its message is a msg type.
+        """
+        e = {'message': ('delete-server',), 'a': 'b',
+             'otter_msg_type': 'delete-server'}
+        self.assertEqual(get_validated_event(e), [e])
+
     def test_message_is_changed(self):
         """
         Event's message is changed with msg type if found.
@@ -292,6 +302,45 @@ class ExecuteConvergenceSplitTests(SynchronousTestCase):
 
         self.assertEqual(result, expected)
 
+    def test_split_servers_without_lb_nodes(self):
+        """
+        An event with no 'lb_nodes' still has its 'servers' split out.
+        """
+        def event(servers):
+            return {'hi': 'there', "servers": servers}
+
+        message = "Executing convergence"
+        result = split_execute_convergence(
+            event([str(i) for i in range(5)]),
+            max_length=len(json.dumps(event(['0', '1']))))
+
+        expected = [
+            ({'hi': 'there'}, message),
+            (event(['0', '1']), message),
+            (event(['2']), message),
+            (event(['3', '4']), message),
+        ]
+
+        self.assertEqual(result, expected)
+
+    def test_split_servers_same_as_split(self):
+        """
+        The servers are split up into exactly the same events as
+        :func:`split` would produce by serializing every candidate event.
+        """
+        servers = [{'id': str(i) * (i % 7 + 1), 'ip': '10.0.0.{}'.format(i)}
+                   for i in range(40)]
+        base = {'hi': 'there', 'lb_nodes': []}
+        max_length = 300
+
+        result = split_execute_convergence(
+            dict(servers=servers, **base), max_length=max_length)
+
+        expected = split(lambda s: {'hi': 'there', 'servers': s}, servers,
+                         max_length, lambda e: len(json.dumps(e)))
+        self.assertEqual(result[1:],
+                         [(e, "Executing convergence") for e in expected])
+
 
 class CFMessageSplitTests(SynchronousTestCase):
     """
@@ -16,7 +16,7 @@ from otter.models.intents import (
 from otter.models.interface import (
     GroupState, IScalingGroupCollection, ScalingGroupStatus)
 from otter.test.utils import (
-    EffectServersCache, IsBoundWith, iMock, matches, mock_group, mock_log)
+    EffectServersCache, IsBoundWith, iStub, matches, mock_group, mock_log)
 
 
 class ScalingGroupIntentsTests(SynchronousTestCase):
@@ -37,7 +37,7 @@ class ScalingGroupIntentsTests(SynchronousTestCase):
         return get_model_dispatcher(self.log, store)
 
     def get_store(self):
-        return iMock(IScalingGroupCollection)
+        return iStub(IScalingGroupCollection)
 
     def perform_with_group(self, eff, expected_lookup, group,
                            fallback_dispatcher=None):
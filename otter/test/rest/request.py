@@ -19,7 +19,7 @@ from twisted.web.server import Request
 from otter.models.interface import IAdmin, IScalingGroupCollection
 from otter.rest.admin import OtterAdmin
 from otter.rest.application import Otter
-from otter.test.utils import iMock, mock_group, patch
+from otter.test.utils import iMock, iStub, mock_group, patch
 from otter.util.config import set_config_data
 
 
@@ -262,7 +262,7 @@ class RequestTestMixin(object):
         """
         if root is None:
             if not hasattr(self, 'root'):
-                root = Otter(iMock(IScalingGroupCollection)).app.resource()
+                root = Otter(iStub(IScalingGroupCollection)).app.resource()
             else:
                 root = self.root
 
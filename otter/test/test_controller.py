@@ -37,6 +37,7 @@ from otter.supervisor import (
 from otter.test.utils import (
     StubResponse,
     iMock,
+    iStub,
     matches,
     mock_group as util_mock_group,
     mock_log,
@@ -1118,7 +1119,7 @@ def mock_group():
     """
     Create a mocked ScalingGroup.
     """
-    group = iMock(IScalingGroup, tenant_id='tenant', uuid='group')
+    group = iStub(IScalingGroup, tenant_id='tenant', uuid='group')
     group.view_config.return_value = defer.succeed("config")
     group.get_policy.return_value = defer.succeed("policy")
     group.view_launch_config.return_value = defer.succeed("launch")
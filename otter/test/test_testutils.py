@@ -15,6 +15,7 @@ from zope.interface import Attribute, Interface
 
 from otter.test.utils import (
     iMock,
+    iStub,
     retry_sequence
 )
 from otter.util.retry import (
@@ -169,6 +170,58 @@ class IMockTests(SynchronousTestCase):
         self.assertEqual(im.another_attribute, 'what')
 
 
+class IStubTests(SynchronousTestCase):
+    """
+    Tests for :func:`iStub`.
+    """
+    def test_provides_all_the_interfaces_passed_to_it(self):
+        """
+        All the attributes on all the interfaces passed to iStub are set, and
+        the stub provides the interfaces.
+        """
+        stub = iStub(_ITest1, _ITest2)
+        self.assertTrue(_ITest1.providedBy(stub))
+        self.assertTrue(_ITest2.providedBy(stub))
+        self.assertTrue(callable(stub.method1))
+        self.assertTrue(callable(stub.method2))
+        self.assertIs(stub.first_attribute, None)
+        self.assertIs(stub.second_attribute, None)
+
+    def test_only_interface_attributes(self):
+        """
+        Only the attributes on the interfaces provided are set, not
+        attributes on other interfaces.
+        """
+        stub = iStub(_ITest1)
+        self.assertRaises(AttributeError, getattr, stub, 'second_attribute')
+        self.assertRaises(AttributeError, getattr, stub, 'method2')
+
+    def test_attributes_from_kwargs(self):
+        """
+        Attributes can be set during creation via kwargs.
+        """
+        stub = iStub(_ITest1, first_attribute='whoosit')
+        self.assertEqual(stub.first_attribute, 'whoosit')
+
+    def test_methods_are_mocks(self):
+        """
+        The methods are mocks, so their return values can be set and their
+        calls inspected.
+        """
+        stub = iStub(_ITest1)
+        stub.method1.return_value = 5
+        self.assertEqual(stub.method1(1, 2), 5)
+        stub.method1.assert_called_once_with(1, 2)
+
+    def test_unknown_kwargs_rejected(self):
+        """
+        Keyword arguments that are not (non-method) attributes of the
+        interfaces raise a `TypeError`.
+        """
+        self.assertRaises(TypeError, iStub, _ITest1, second_attribute=1)
+        self.assertRaises(TypeError, iStub, _ITest1, method1=1)
+
+
 class RetrySequenceTests(SynchronousTestCase):
     """Tests for :func:`retry_sequence`."""
 
@@ -184,6 +184,14 @@ class HTTPUtilityTests(SynchronousTestCase):
         """
         self.assertNotIn('x-auth-token', headers())
 
+    def test_headers_token_not_shared(self):
+        """
+        Each call to headers produces a new dictionary, so the auth token from
+        one call does not leak into the headers produced by another.
+        """
+        headers('my-auth-token')
+        self.assertNotIn('x-auth-token', headers())
+
     def test_connection_error(self):
         """
         A :class:`RequestError` instantiated with a netloc and a wrapped
@@ -5,7 +5,7 @@ from pyrsistent import pmap
 from twisted.trial.unittest import SynchronousTestCase
 
 from otter.util.fp import (
-    assoc_obj, predicate_all, predicate_any, set_in)
+    assoc_obj, predicate_all, predicate_any, set_in, wrappers)
 
 
 class PredicateAllTests(SynchronousTestCase):
@@ -151,3 +151,22 @@ class AssocObjTests(SynchronousTestCase):
         self.assertEqual(o.name, "foo")
         self.assertEqual(new.name, "bar")
         self.assertIs(o.l, new.l)
+
+
+class WrappersTests(SynchronousTestCase):
+    """
+    Tests for :func:`otter.util.fp.wrappers`
+    """
+
+    def test_wraps_innermost_first(self):
+        """
+        The first function is innermost and each later one wraps the
+        previous combination.
+        """
+        def inner(x):
+            return [x]
+
+        def outer(f, x):
+            return f(x) + ['outer']
+
+        self.assertEqual(wrappers(inner, outer)(1), [1, 'outer'])
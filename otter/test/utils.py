@@ -25,7 +25,7 @@ from pyrsistent import freeze, pmap
 
 from testtools.matchers import MatchesException, Mismatch
 
-from toolz.functoolz import compose
+from toolz.functoolz import compose, memoize
 
 import treq
 
@@ -185,18 +185,20 @@ class IsCallable(object):
         return callable(other)
 
 
+@memoize
 def fixture(fixture_name):
     """
+    Read a fixture file.  Each fixture is only read from disk once, and the
+    contents are reused for subsequent calls.
+
     :param fixture_name: The base filename of the fixture, ex: simple.atom.
     :type: ``bytes``
 
     :returns: ``bytes``
     """
-    return open(os.path.join(
-        os.path.dirname(__file__),
-        'fixtures',
-        fixture_name
-    )).read()
+    path = os.path.join(os.path.dirname(__file__), 'fixtures', fixture_name)
+    with open(path, 'rb') as f:
+        return f.read()
 
 
 def iMock(*ifaces, **kwargs):
@@ -250,6 +252,48 @@ def iMock(*ifaces, **kwargs):
     return imock
 
 
+class _Stub(object):
+    """
+    A plain object for :func:`iStub` to set interface attributes on.
+    """
+
+
+def iStub(*ifaces, **kwargs):
+    """
+    Creates a cheap stub object that provides a particular interface.
+
+    Unlike :func:`iMock`, the methods are plain :class:`mock.Mock` objects
+    that do not check their signatures, and the stub itself is not a mock, so
+    it is much faster to create.  Use it where the test does not care how the
+    methods are called.
+
+    :param iface: the interface to provide
+    :type iface: :class:``zope.interface.Interface``
+    :param kwargs: values for (non-method) attributes of the interface
+
+    :returns: an object that has the attributes and methods of a provider of
+        the interface
+    :raises: `TypeError` if a keyword argument is not a non-method attribute
+        of one of the interfaces
+    """
+    stub = _Stub()
+    directlyProvides(stub, *ifaces)
+    attributes = set()
+    for iface in ifaces:
+        for attr in iface:
+            if isinstance(iface[attr], interface.Method):
+                setattr(stub, attr, mock.Mock())
+            elif isinstance(iface[attr], interface.Attribute):
+                attributes.add(attr)
+                setattr(stub, attr, kwargs.get(attr, None))
+
+    unknown = set(kwargs) - attributes
+    if unknown:
+        raise TypeError(
+            "Not attributes of the interfaces: {}".format(sorted(unknown)))
+    return stub
+
+
 def patch(testcase, *args, **kwargs):
     """
     Patches and starts a test case, taking care of the cleanup.
@@ -3,6 +3,7 @@
 """Functional programming utilities."""
 
 from copy import copy
+from functools import partial
 
 from pyrsistent import freeze, pmap
 
@@ -25,7 +26,7 @@ def wrap(f, g):
     wants to call f, instead of just referring to f directly, it can accept
     it as a parameter.
     """
-    return lambda *args, **kwargs: g(f, *args, **kwargs)
+    return partial(g, f)
 
 
 def wrappers(*stuff):
@@ -231,6 +231,13 @@ def check_success(response, success_codes, _treq=None):
     return response
 
 
+# Headers common to every request. The value lists are shared between all the
+# dicts returned by `headers`, so they must not be mutated.
+_common_headers = {'content-type': ['application/json'],
+                   'accept': ['application/json'],
+                   'User-Agent': ['OtterScale/0.0']}
+
+
 def headers(auth_token=None):
     """
     Generate an appropriate set of headers given an auth_token.
@@ -238,9 +245,7 @@ def headers(auth_token=None):
     :param str auth_token: The auth_token or None.
     :return: A dict of common headers.
     """
-    h = {'content-type': ['application/json'],
-         'accept': ['application/json'],
-         'User-Agent': ['OtterScale/0.0']}
+    h = dict(_common_headers)
 
     if auth_token is not None:
         h['x-auth-token'] = [auth_token]